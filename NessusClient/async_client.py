@@ -0,0 +1,430 @@
+import asyncio
+import time
+
+import aiohttp
+import orjson
+
+from .nessus_client import _MAX_ATTEMPTS, NessusError, _p, _retry_delay, logger
+
+
+def _dumps(obj) -> str:
+    return orjson.dumps(obj).decode()
+
+
+class AsyncNessusClient:
+
+
+    def __init__(self, server: str, username: str = None, password: str = None,
+                 access_key: str = None, secret_key: str = None, verify_cert=True):
+        """Asynchronous counterpart to NessusClient, built on aiohttp. Every endpoint is a coroutine,
+           so batch-style callers can await many per-host/per-plugin calls concurrently, e.g. with
+           asyncio.gather(). Use as an async context manager so the underlying session is closed.
+
+        Args:
+            server (str): Server:port combination (IE, https://server:8834)
+            username (str): Username with which to login.
+            password (str): Password associated with above username.
+            access_key (str): accessKey created via UI or /session/keys endpoint.
+            secret_key (str): secretKey created via UI or /session/keys endpoint.
+            verify_cert (bool, optional): Verify the server's TLS certificate. Defaults to True.
+        """
+
+        self.username = username
+        self.password = password
+        self.base_url = server
+        self.verify_cert = verify_cert
+        self.headers = {}
+
+        if access_key and secret_key:
+            self.headers["X-ApiKeys"] = f"accessKey={access_key}; secretKey={secret_key}"
+
+        self._session = None
+        self._export_formats_cache = {}  # scan_id -> (fetched at, formats)
+
+
+    @property
+    def session(self):
+        """
+        aiohttp session shared by every request; created on first use so it is bound to the running loop.
+        """
+
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(ssl=self.verify_cert, limit=64, limit_per_host=32,
+                                             keepalive_timeout=75)
+            self._session = aiohttp.ClientSession(base_url=self.base_url, connector=connector,
+                                                  headers=self.headers, json_serialize=_dumps)
+
+        return self._session
+
+
+    async def close(self):
+        """
+        Destroy the API session if session_create() was used, then close the aiohttp session.
+        """
+
+        if self._session is None:
+            return
+
+        try:
+            if "X-Cookie" in self.headers and not self._session.closed:
+                async with self._session.delete("/session", timeout=aiohttp.ClientTimeout(total=5)):
+                    pass
+                del self.headers["X-Cookie"]
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            logger.debug("DELETE /session failed while closing the session", exc_info=True)
+        finally:
+            await self._session.close()
+            self._session = None
+
+
+    async def __aenter__(self):
+        return self
+
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+
+    async def _request(self, method: str, path: str, **kwargs):
+        """
+        Send a request and return its decoded JSON body, waiting out HTTP 429 rate limiting.
+
+        Raises:
+            NessusError: The scanner answered with anything other than 200.
+        """
+
+        for attempt in range(_MAX_ATTEMPTS):
+            async with self.session.request(method, path, **kwargs) as response:
+                if response.status == 200:
+                    return orjson.loads(await response.read())
+
+                logger.debug("%s %s -> %d", method, path, response.status)
+
+                if response.status != 429 or attempt == _MAX_ATTEMPTS - 1:
+                    raise NessusError(response.status, text=await response.text())
+                delay = _retry_delay(response.headers)
+
+            await asyncio.sleep(delay)
+
+
+    async def _download(self, path: str, dest=None, chunk_size: int = 65536):
+        """
+        Stream a file download into memory, or straight to dest (a path or writable file object).
+        """
+
+        async with self.session.get(path) as response:
+            if response.status != 200:
+                logger.debug("GET %s -> %d", path, response.status)
+                raise NessusError(response.status, text=await response.text())
+
+            if dest is None:
+                buffer = bytearray()
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    buffer.extend(chunk)
+                return bytes(buffer)
+
+            if hasattr(dest, "write"):
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    dest.write(chunk)
+            else:
+                with open(dest, "wb") as file:
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        file.write(chunk)
+
+            return dest
+
+
+    async def session_create(self):
+        """
+        Only usable if you've supplied a username and password during initial instantiation.
+        """
+
+        payload = {
+            "username": self.username,
+            "password": self.password
+        }
+
+        token = (await self._request("POST", "/session", json=payload))["token"]
+        self.headers["X-Cookie"] = f"token={token};"
+        self.session.headers["X-Cookie"] = self.headers["X-Cookie"]
+
+
+    async def server_properties(self):
+        """
+        Retrieve server version and other properties.
+        """
+
+        return await self._request("GET", "/server/properties")
+
+
+    async def server_status(self):
+        """
+        Retrieve server status (loading, ready, corrupt-db, feed-expired, eval-expired, locked,
+        register, register-locked, download-failed, feed-error).
+        """
+
+        try:
+            return await self._request("GET", "/server/status")
+        except NessusError as error:
+            if error.status_code != 503:
+                raise
+            return {
+                "status": "503 - Session Destroy required."
+            }
+
+
+    async def server_health_alerts(self, end_time: int = None, start_time: int = None):
+        """
+        List alerts created by the scanner regarding its overall health.
+
+        Args:
+            end_time (int, optional): End time for historical data (unixtime); defaults to now.
+            start_time (int, optional): Start time for historical data (unixtime); defaults to 24 hrs ago.
+        """
+
+        return await self._request("GET", "/settings/health/alerts",
+                                   params=_p(end_time=end_time, start_time=start_time))
+
+
+    async def scans_attachment(self, scan_id: str, attachment_id: str, key: str, dest=None, chunk_size: int = 65536):
+        """
+        Retrieve requested scan attachment file.
+
+        Args:
+            scan_id (str): ID of the scan containing the attachment.
+            attachment_id (str): ID of the scan attachment.
+            key (str): Attachment access token.
+            dest (str or file, optional): Path or file object to stream the attachment into.
+                                          If omitted, the attachment is returned as bytes.
+            chunk_size (int, optional): Bytes read per chunk while streaming. Defaults to 64 KiB.
+        """
+
+        return await self._download(f"/scans/{scan_id}/attachments/{attachment_id}", dest, chunk_size)
+
+
+    async def scans_configure(self, scan_id: int, uuid: str, settings: dict):
+        """
+        Remotely configure schedule and/or policy parameters of a scan.
+
+        Args:
+            scan_id (int): ID of the scan to change.
+            uuid (str): UUID for the editor template to use.
+            settings (dict): Scan settings to apply.
+        """
+
+        payload = {
+            "uuid": uuid,
+            "settings": settings
+        }
+
+        return await self._request("PUT", f"/scans/{scan_id}", json=payload)
+
+
+    async def scans_details(self, scan_id: int):
+        """
+        Retrieve details for a given scan based on ID.
+
+        Args:
+            scan_id (int): ID of scan to retrieve.
+        """
+
+        return await self._request("GET", f"/scans/{scan_id}")
+
+
+    async def scans_details_iter_hosts(self, scan_id: int, chunk_size: int = 65536):
+        """
+        Stream the hosts of a scan one at a time instead of loading the whole details document.
+        scans_details() is fine for small scans; prefer this for large ones. Requires the optional ijson dependency.
+
+        Args:
+            scan_id (int): ID of scan to retrieve.
+            chunk_size (int, optional): Bytes read per chunk while streaming. Defaults to 64 KiB.
+
+        Yields:
+            dict: One entry of the scan's hosts list.
+        """
+
+        import ijson
+
+        async with self.session.get(f"/scans/{scan_id}") as response:
+            if response.status != 200:
+                logger.debug("GET /scans/%s -> %d", scan_id, response.status)
+                raise NessusError(response.status, text=await response.text())
+
+            hosts = ijson.sendable_list()
+            parser = ijson.items_coro(hosts, "hosts.item", use_float=True)
+
+            async for chunk in response.content.iter_chunked(chunk_size):
+                parser.send(chunk)
+                for host in hosts:
+                    yield host
+                del hosts[:]
+
+            parser.close()
+            for host in hosts:
+                yield host
+
+
+    async def scans_export_formats(self, scan_id: int, ttl: float = 300):
+        """
+        Retrieve available export formats and report options. Results are remembered per scan for ttl seconds.
+
+        Args:
+            scan_id (int): ID of scan to export.
+            ttl (float, optional): Seconds a previously fetched result stays valid; 0 always refetches. Defaults to 300.
+        """
+
+        cached = self._export_formats_cache.get(scan_id)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        formats = await self._request("GET", f"/scans/{scan_id}/export/formats")
+        self._export_formats_cache[scan_id] = (time.monotonic(), formats)
+
+        return formats
+
+
+    async def scans_export_download(self, scan_id: int, file_id: int, dest=None, chunk_size: int = 65536):
+        """
+        Download an exported scan. Use this method in conjunction with scans_export_request()
+        and scans_export_wait().
+
+        Args:
+            scan_id (int): ID of scan to export.
+            file_id (int): ID of file to download (retrieved from scans_export_request() method).
+            dest (str or file, optional): Path or file object to stream the export into.
+                                          If omitted, the export is returned as bytes.
+            chunk_size (int, optional): Bytes read per chunk while streaming. Defaults to 64 KiB.
+        """
+
+        return await self._download(f"/scans/{scan_id}/export/{file_id}/download", dest, chunk_size)
+
+
+    async def scans_export_request(self, scan_id: int, format: str, scan_info: bool = True, host_info: bool = True, base_score: bool = True,
+                                   synopsis: bool = True, description: bool = True, see_also: bool = True, solution: bool = True, temporal_score: bool = True,
+                                   risk_factor: bool = True, base_score_v3: bool = True, temporal_score_v3: bool = True, stig: bool = True,
+                                   references: bool = True, exploitable_with: bool = True, plugin_info: bool = True, plugin_output: bool = True):
+        """
+        Export a given scan using its ID.
+
+        Args:
+            scan_id (int): ID of scan to export.
+            format (str): File format to use (Nessus, HTML, PDF, CSV, or DB).
+        """
+
+        payload = {
+                    "format": format,
+                    "reportContents":
+                        {
+                         "hostSections":
+                            {
+                             "host_information": host_info,
+                             "scan_information": scan_info
+                             },
+                         "vulnerabilitySections":
+                            {
+                             "description": description,
+                             "see_also": see_also,
+                             "solution": solution,
+                             "risk_factor": risk_factor,
+                             "cvss_base_score": base_score,
+                             "cvss_temporal_score": temporal_score,
+                             "cvss3_base_score": base_score_v3,
+                             "cvss3_temporal_score": temporal_score_v3,
+                             "stig_severity": stig,
+                             "references": references,
+                             "exploitable_with": exploitable_with,
+                             "plugin_information": plugin_info,
+                             "plugin_output": plugin_output
+                             }
+                        }
+                    }
+
+        return await self._request("POST", f"/scans/{scan_id}/export", json=payload)
+
+
+    async def scans_export_status(self, scan_id: int, file_id: int):
+        """
+        Check the file status of an exported scan.
+
+        Args:
+            scan_id (int): ID of requested scan.
+            file_id (int): ID of file to poll.
+        """
+
+        return await self._request("GET", f"/scans/{scan_id}/export/{file_id}/status")
+
+
+    async def scans_export_wait(self, scan_id: int, file_id: int, poll_initial: float = 0.5, poll_max: float = 8.0,
+                                timeout: float = 600):
+        """
+        Poll an export with exponential backoff until it is ready. Preferred over looping on
+        scans_export_status(); call it between scans_export_request() and scans_export_download().
+
+        Args:
+            scan_id (int): ID of requested scan.
+            file_id (int): ID of file to poll.
+            poll_initial (float, optional): Seconds to wait after the first poll. Defaults to 0.5.
+            poll_max (float, optional): Upper bound on the wait between polls. Defaults to 8.
+            timeout (float, optional): Seconds to wait before giving up. Defaults to 600.
+
+        Raises:
+            RuntimeError: The scanner reported the export as failed.
+            TimeoutError: The export was not ready within timeout seconds.
+        """
+
+        delay = poll_initial
+        deadline = time.monotonic() + timeout
+
+        while time.monotonic() < deadline:
+            status = await self.scans_export_status(scan_id, file_id)
+
+            if status.get("status") == "ready":
+                return status
+            if status.get("status") == "error":
+                raise RuntimeError(f"Export {file_id} of scan {scan_id} failed on the scanner.")
+
+            await asyncio.sleep(max(0.0, min(delay, deadline - time.monotonic())))
+            delay = min(delay * 1.7, poll_max)
+
+        raise TimeoutError(f"Export {file_id} of scan {scan_id} not ready after {timeout} seconds.")
+
+
+    async def scans_host_details(self, scan_id: int, host_id: int):
+        """
+        Retrieve details for a given host.
+
+        Args:
+            scan_id (int): ID of scan to retrieve.
+            host_id (int): ID of the host to retrieve.
+        """
+
+        return await self._request("GET", f"/scans/{scan_id}/hosts/{host_id}")
+
+
+    async def scans_list(self, folder_id: int = None, last_mod_date: int = None):
+        """
+        Retrieve the scan list.
+
+        Args:
+            folder_id (int): ID of folder whose scans should be listed.
+            last_mod_date (int): Limit results to those that have only changed since this time.
+        """
+
+        return await self._request("GET", "/scans",
+                                   params=_p(folder_id=folder_id, last_modification_date=last_mod_date))
+
+
+    async def scans_plugin_output(self, scan_id: int, host_id: int, plugin_id: int, history_id: int = None):
+        """
+        Retrieve output for a given plugin.
+
+        Args:
+            scan_id (int): ID of scan to retrieve.
+            host_id (int): ID of the host to retrieve.
+            plugin_id (int): ID of plugin to retrieve.
+            history_id (int, optional): Historical_ID of the historical data to retrieve.
+        """
+
+        return await self._request("GET", f"/scans/{scan_id}/hosts/{host_id}/plugins/{plugin_id}",
+                                   params=_p(history_id=history_id))
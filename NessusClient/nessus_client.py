@@ -1,11 +1,98 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, suppress
+
+import logging
+import math
+import os
+import time
+import weakref
+
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+logger = logging.getLogger(__name__)
+
+# Attempts _request makes while the scanner keeps answering HTTP 429.
+_MAX_ATTEMPTS = 4
+
+
+def _retry_delay(headers, default: float = 1.0, max_retry_after: float = 60.0) -> float:
+    """
+    Seconds to wait according to a Retry-After header, falling back to default if it is
+    missing or not a finite number of seconds (e.g. an HTTP date). Clamped to [0, max_retry_after].
+    """
+
+    try:
+        delay = float(headers.get("Retry-After", default))
+    except ValueError:
+        return default
+
+    return min(max(0.0, delay), max_retry_after) if math.isfinite(delay) else default
+
+
+def _p(**kwargs):
+    """
+    Query params with unset (None) values dropped; None when nothing is left.
+    """
+
+    return {key: value for key, value in kwargs.items() if value is not None} or None
+
+
+def _close_session(session, logout_url: str, timeout: float = 5):
+    """
+    Log out of a token-based API session if one was created, then release the pooled connections.
+    The logout is bounded by timeout so an unreachable scanner cannot stall interpreter shutdown.
+    """
+
+    try:
+        if "X-Cookie" in session.headers:
+            session.delete(logout_url, timeout=timeout)
+    except Exception:
+        logger.debug("DELETE %s failed while closing the session", logout_url, exc_info=True)
+    finally:
+        session.close()
+
+
+class NessusError(Exception):
+    """
+    Raised when the Nessus API answers a request with a non-200 status.
+    The response body is only decoded if the caller reads the text attribute.
+    """
+
+    def __init__(self, status_code: int, response=None, text: str = None):
+        super().__init__(status_code)
+        self.status_code = status_code
+        self.response = response
+        self._text = text
+
+
+    def __str__(self):
+        return f"Nessus API returned HTTP {self.status_code}"
+
+
+    @property
+    def text(self) -> str:
+        if self._text is None and self.response is not None:
+            self._text = self.response.text
+        return self._text
 
 
 class NessusClient:
 
+    # Default (all sections enabled) reportContents for scans_export_request; shared, never mutated.
+    _EXPORT_HOST_SECTIONS = {"host_information": True, "scan_information": True}
+    _EXPORT_VULN_SECTIONS = dict.fromkeys(("description", "see_also", "solution", "risk_factor", "cvss_base_score",
+                                           "cvss_temporal_score", "cvss3_base_score", "cvss3_temporal_score",
+                                           "stig_severity", "references", "exploitable_with", "plugin_information",
+                                           "plugin_output"), True)
+
 
     def __init__(self, server: str, username: str = None, password: str = None, 
-                 access_key: str = None, secret_key: str = None, verify_cert=True):
+                 access_key: str = None, secret_key: str = None, verify_cert=True, pool_maxsize: int = 64,
+                 use_http2: bool = False, cache_ttl: int = 0):
         """Instance construction. Need to either supply username/password combo or API keys.
            If using API Keys, there is no need to deal with the /session set of resources.
 
@@ -16,16 +103,221 @@ class NessusClient:
             access_key (str): accessKey created via UI or /session/keys endpoint.
             secret_key (str): secretKey created via UI or /session/keys endpoint.
             verify_cert (bool, optional): [description]. Defaults to True.
+            pool_maxsize (int, optional): Connections kept alive per host for concurrent callers. Defaults to 64.
+            use_http2 (bool, optional): Use httpx over HTTP/2 so concurrent calls share one connection.
+                                        Requires the optional httpx[http2] dependency. Defaults to False.
+            cache_ttl (int, optional): Seconds to cache GET responses for; 0 disables caching. Requires the
+                                       optional requests-cache dependency and is ignored with use_http2.
+                                       Defaults to 0.
         """
 
         self.username = username
         self.password = password
         self.base_url = server
-        self.session = requests.session()
-        self.session.verify = verify_cert
+        self.http2 = use_http2
+        self.pool_maxsize = pool_maxsize
+        self._export_formats_cache = {}  # scan_id -> (fetched at, formats)
+
+        if use_http2:
+            import httpx
+
+            self.session = httpx.Client(base_url=server, http2=True, verify=verify_cert,
+                                        limits=httpx.Limits(max_connections=pool_maxsize,
+                                                            max_keepalive_connections=32))
+        elif cache_ttl:
+            import requests_cache
+
+            # Status polling and file downloads must always reach the scanner.
+            self.session = requests_cache.CachedSession(
+                backend="memory", expire_after=cache_ttl, allowable_methods=("GET",), cache_control=True,
+                urls_expire_after={
+                    "*/server/status": requests_cache.DO_NOT_CACHE,
+                    "*/scans/*/export/*/status": requests_cache.DO_NOT_CACHE,
+                    "*/scans/*/export/*/download": requests_cache.DO_NOT_CACHE,
+                    "*/scans/*/attachments/*": requests_cache.DO_NOT_CACHE,
+                    "*/server/properties": 3600,
+                    "*/scans/*/export/formats": 1800,
+                })
+        else:
+            self.session = requests.session()
+
+        if not use_http2:
+            self.session.verify = verify_cert
+
+            # Only idempotent calls are retried; POST could duplicate exports or logins. 503 is left
+            # alone so server_status() reports it immediately, and 429 is handled by _request().
+            adapter = HTTPAdapter(
+                pool_connections=32, pool_maxsize=pool_maxsize, pool_block=False,
+                max_retries=Retry(total=3, backoff_factor=0.3, raise_on_status=False,
+                                  status_forcelist=(500, 502, 504), respect_retry_after_header=False,
+                                  allowed_methods=frozenset(["GET", "PUT"])))
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
 
         if access_key and secret_key:
-            self.session.headers = {"X-ApiKeys": f"accessKey={access_key}; secretKey={secret_key}"}
+            self.session.headers.update({"X-ApiKeys": f"accessKey={access_key}; secretKey={secret_key}"})
+
+
+    @property
+    def session(self):
+        """
+        HTTP session used for every request. Assigning a new one re-binds _request to it and moves the
+        close-on-exit finalizer over; the previous session is left for the caller to close.
+        """
+
+        return self._session
+
+
+    @session.setter
+    def session(self, session):
+        self._session = session
+        # Bound once so _request skips the session attribute lookup on every call.
+        self._send = session.request
+
+        if getattr(self, "_finalizer", None) is not None:
+            self._finalizer.detach()
+        # Closes the session on close(), on garbage collection, or at interpreter exit, whichever comes first.
+        self._finalizer = weakref.finalize(self, _close_session, session, self.base_url + "/session")
+
+
+    def close(self):
+        """
+        Destroy the API session if session_create() was used, then close the HTTP session.
+        """
+
+        self._finalizer()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+    def bust_cache(self):
+        """
+        Drop remembered export formats and, if the client was created with cache_ttl, cached GET
+        responses. Call it e.g. after scans_configure() or session_create().
+        """
+
+        self._export_formats_cache.clear()
+
+        if hasattr(self.session, "cache"):
+            self.session.cache.clear()
+
+
+    def _json(self, response):
+        """
+        Decode a JSON response body with orjson rather than the stdlib json module.
+        """
+
+        return orjson.loads(response.content)
+
+
+    def _request(self, method: str, url: str, **kwargs):
+        """
+        Send a request and return its decoded JSON body, waiting out HTTP 429 rate limiting.
+
+        Raises:
+            NessusError: The scanner answered with anything other than 200.
+        """
+
+        for attempt in range(_MAX_ATTEMPTS):
+            response = self._send(method, url, **kwargs)
+
+            if response.status_code == 200:
+                return self._json(response)
+
+            logger.debug("%s %s -> %d", method, url, response.status_code)
+
+            if response.status_code != 429 or attempt == _MAX_ATTEMPTS - 1:
+                raise NessusError(response.status_code, response)
+
+            time.sleep(_retry_delay(response.headers))
+
+
+    def _json_body(self, payload):
+        """
+        Request kwargs that send payload as an orjson-encoded JSON body on either transport.
+        """
+
+        body_kwarg = "content" if self.http2 else "data"
+
+        return {body_kwarg: orjson.dumps(payload), "headers": {"Content-Type": "application/json"}}
+
+
+    @contextmanager
+    def _stream(self, url: str, status: int = 200, **kwargs):
+        """
+        Stream a GET response on either transport, yielding the response and its chunk iterator.
+
+        Raises:
+            NessusError: The scanner answered with anything other than status.
+        """
+
+        if self.http2:
+            stream = self.session.stream("GET", url, **kwargs)
+            get_chunks = "iter_bytes"
+        else:
+            stream = self.session.get(url, stream=True, **kwargs)
+            get_chunks = "iter_content"
+
+        with stream as response:
+            if response.status_code != status:
+                logger.debug("GET %s -> %d", url, response.status_code)
+                if self.http2:
+                    response.read()
+                raise NessusError(response.status_code, text=response.text)
+
+            yield response, getattr(response, get_chunks)
+
+
+    def _download(self, url: str, dest=None, chunk_size: int = 65536):
+        """
+        Stream a file download into memory, or straight to dest (a path or writable file object).
+        """
+
+        with self._stream(url) as (response, iter_chunks):
+            if dest is None:
+                buffer = bytearray()
+                for chunk in iter_chunks(chunk_size):
+                    buffer.extend(chunk)
+                return bytes(buffer)
+
+            if hasattr(dest, "write"):
+                for chunk in iter_chunks(chunk_size):
+                    dest.write(chunk)
+            else:
+                with open(dest, "wb") as file:
+                    for chunk in iter_chunks(chunk_size):
+                        file.write(chunk)
+
+            return dest
+
+
+    def _fan_out(self, fetch, items, max_workers: int):
+        """
+        Run fetch(item) -> (key, value) over a thread pool and collect the results into a dict.
+        The first failure cancels every request that has not started yet and is re-raised.
+        """
+
+        results = {}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, self.pool_maxsize)) as executor:
+            futures = [executor.submit(fetch, item) for item in items]
+
+            try:
+                for future in as_completed(futures):
+                    key, value = future.result()
+                    results[key] = value
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        return results
 
 
     def session_create(self):
@@ -38,12 +330,8 @@ class NessusClient:
             "password": self.password
         }
 
-        response = self.session.post(self.base_url + "/session", json=payload)
-
-        if response.status_code == 200:
-            self.session.headers["X-Cookie"] = f'token={response.json()["token"]};'
-        else:
-            print(response.status_code, "\n", response.headers, "\n", response.text)
+        token = self._request("POST", self.base_url + "/session", json=payload)["token"]
+        self.session.headers.update({"X-Cookie": f"token={token};"})
 
 
     def server_properties(self):
@@ -51,12 +339,7 @@ class NessusClient:
         Retrieve server version and other properties.
         """
 
-        response = self.session.get(self.base_url + "/server/properties")
-
-        if response.status_code == 200:
-            return response.json()
-        else:
-            print(response.status_code, "\n", response.headers, "\n", response.text)
+        return self._request("GET", self.base_url + "/server/properties")
 
     
     def server_status(self):
@@ -65,11 +348,11 @@ class NessusClient:
         register, register-locked, download-failed, feed-error).
         """
 
-        response = self.session.get(self.base_url + "/server/status")
-
-        if response.status_code == 200:
-            return response.json()
-        elif response.status_code == 503:
+        try:
+            return self._request("GET", self.base_url + "/server/status")
+        except NessusError as error:
+            if error.status_code != 503:
+                raise
             return {
                 "status": "503 - Session Destroy required."
             }
@@ -84,22 +367,11 @@ class NessusClient:
             start_time (int, optional): Start time for historical data (unixtime); defaults to 24 hrs ago.
         """
 
-        params = {}
-
-        if end_time:
-            params["end_time"] = end_time
-        if start_time:
-            params["start_time"] = start_time
-
-        response = self.session.get(self.base_url + "/settings/health/alerts", params=params)
-
-        if response.status_code == 200:
-            return response.json()
-        else:
-            print(response.status_code, "\n", response.headers, "\n", response.text)
+        return self._request("GET", self.base_url + "/settings/health/alerts",
+                             params=_p(end_time=end_time, start_time=start_time))
 
     
-    def scans_attachment(self, scan_id: str, attachment_id: str, key: str):
+    def scans_attachment(self, scan_id: str, attachment_id: str, key: str, dest=None, chunk_size: int = 65536):
         """
         Retrieve requested scan attachment file.
 
@@ -107,14 +379,12 @@ class NessusClient:
             scan_id (str): ID of the scan containing the attachment.
             attachment_id (str): ID of the scan attachment.
             key (str): Attachment access token.
+            dest (str or file, optional): Path or file object to stream the attachment into.
+                                          If omitted, the attachment is returned as bytes.
+            chunk_size (int, optional): Bytes read per chunk while streaming. Defaults to 64 KiB.
         """
 
-        response = self.session.get(self.base_url + f"/scans/{scan_id}/attachments/{attachment_id}")
-
-        if response.status_code == 200:
-            return response.content
-        else:
-            print(response.status_code, "\n", response.headers, "\n", response.text)
+        return self._download(self.base_url + f"/scans/{scan_id}/attachments/{attachment_id}", dest, chunk_size)
     
 
     def scans_configure(self, scan_id: int, uuid: str, settings: dict):
@@ -124,7 +394,7 @@ class NessusClient:
         Args:
             scan_id (int): ID of the scan to change.
             uuid (str): UUID for the editor template to use.
-            kwargs (dict): 
+            settings (dict): Scan settings to apply.
         """
         
         payload = {
@@ -132,12 +402,7 @@ class NessusClient:
             "settings": settings
         }
 
-        response = self.session.put(self.base_url + f"/scans/{scan_id}", data=payload)
-
-        if response.status_code == 200:
-            return response.json()
-        else:
-            print(response.status_code, "\n", response.headers, "\n", response.text)
+        return self._request("PUT", self.base_url + f"/scans/{scan_id}", **self._json_body(payload))
 
     
     def scans_details(self, scan_id: int):
@@ -148,47 +413,154 @@ class NessusClient:
             scan_id (int): ID of scan to retrieve.
         """
 
-        response = self.session.get(self.base_url + f"/scans/{scan_id}")
+        return self._request("GET", self.base_url + f"/scans/{scan_id}")
 
-        if response.status_code == 200:
-            return response.json()
-        else:
-            print(response.status_code, "\n", response.headers, "\n", response.text)
+
+    def scans_details_iter_hosts(self, scan_id: int, chunk_size: int = 65536):
+        """
+        Stream the hosts of a scan one at a time instead of loading the whole details document.
+        scans_details() is fine for small scans; prefer this for large ones. Requires the optional ijson dependency.
+
+        Args:
+            scan_id (int): ID of scan to retrieve.
+            chunk_size (int, optional): Bytes read per chunk while streaming. Defaults to 64 KiB.
+
+        Yields:
+            dict: One entry of the scan's hosts list.
+        """
+
+        import ijson
+
+        kwargs = {}
+
+        if hasattr(self.session, "cache"):
+            # A cached response would be read and stored whole, undoing the streaming. no-store makes
+            # requests-cache skip both the lookup and the write (a per-request DO_NOT_CACHE only skips the lookup).
+            kwargs["headers"] = {"Cache-Control": "no-store"}
+
+        with self._stream(self.base_url + f"/scans/{scan_id}", **kwargs) as (response, iter_chunks):
+            hosts = ijson.sendable_list()
+            parser = ijson.items_coro(hosts, "hosts.item", use_float=True)
+
+            for chunk in iter_chunks(chunk_size):
+                parser.send(chunk)
+                yield from hosts
+                del hosts[:]
+
+            parser.close()
+            yield from hosts
 
     
-    def scans_export_formats(self, scan_id: int):
+    def scans_export_formats(self, scan_id: int, ttl: float = 300):
         """
-        Retrieve available export formats and report options.
+        Retrieve available export formats and report options. Results are remembered per scan for ttl seconds.
 
         Args:
             scan_id (int): ID of scan to export.
+            ttl (float, optional): Seconds a previously fetched result stays valid; 0 always refetches. Defaults to 300.
         """
 
-        response = self.session.get(self.base_url + f"/scans/{scan_id}/export/formats")
+        cached = self._export_formats_cache.get(scan_id)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
 
-        if response.status_code == 200:
-            return response.json()
-        else:
-            print(response.status_code, "\n", response.headers, "\n", response.text)
+        formats = self._request("GET", self.base_url + f"/scans/{scan_id}/export/formats")
+        self._export_formats_cache[scan_id] = (time.monotonic(), formats)
+
+        return formats
     
 
-    def scans_export_download(self, scan_id: int, file_id: int):
+    def scans_export_download(self, scan_id: int, file_id: int, dest=None, chunk_size: int = 65536):
         """
-        Download an exported scan. Use this method in conjunction with scans_export_request().
+        Download an exported scan. Use this method in conjunction with scans_export_request()
+        and scans_export_wait().
 
         Args:
             scan_id (int): ID of scan to export.
             file_id (int): ID of file to download (retrieved from scans_export_request() method).
+            dest (str or file, optional): Path or file object to stream the export into.
+                                          If omitted, the export is returned as bytes.
+            chunk_size (int, optional): Bytes read per chunk while streaming. Defaults to 64 KiB.
         """
 
-        response = self.session.get(self.base_url + f"/scans/{scan_id}/export/{file_id}/download")
-
-        if response.status_code == 200:
-            return response.content
-        else:
-            print(response.status_code, "\n", response.headers, "\n", response.text)
+        return self._download(self.base_url + f"/scans/{scan_id}/export/{file_id}/download", dest, chunk_size)
 
     
+    def scans_export_download_parallel(self, scan_id: int, file_id: int, dest: str, parts: int = 8,
+                                       chunk_size: int = 65536):
+        """
+        Download an exported scan into dest using parallel HTTP Range requests, which helps on
+        high-latency links for very large exports. Falls back to scans_export_download() when the
+        server does not advertise byte ranges.
+
+        Args:
+            scan_id (int): ID of scan to export.
+            file_id (int): ID of file to download (retrieved from scans_export_request() method).
+            dest (str): Path to write the export to.
+            parts (int, optional): Number of ranges fetched concurrently; capped at pool_maxsize. Defaults to 8.
+            chunk_size (int, optional): Bytes read per chunk while streaming. Defaults to 64 KiB.
+
+        Raises:
+            ValueError: parts is less than 1.
+            NessusError: A range request was answered with something other than 206 (a 200, from a
+                         proxy that ignores Range, falls back to scans_export_download() instead).
+            OSError: A range returned a different number of bytes than requested.
+        """
+
+        if parts < 1:
+            raise ValueError(f"parts must be at least 1, got {parts}.")
+
+        url = self.base_url + f"/scans/{scan_id}/export/{file_id}/download"
+        # Ranges must address the stored file, not a compressed transfer of it.
+        identity = {"Accept-Encoding": "identity"}
+
+        head = self.session.head(url, headers=identity)
+        size = 0
+
+        if head.status_code == 200 and head.headers.get("Accept-Ranges") == "bytes":
+            try:
+                size = int(head.headers.get("Content-Length", 0))
+            except ValueError:
+                pass
+
+        if size <= 0:
+            return self.scans_export_download(scan_id, file_id, dest, chunk_size)
+
+        parts = min(parts, size, self.pool_maxsize)
+
+        def fetch(part):
+            start, end = part * size // parts, (part + 1) * size // parts - 1
+            headers = dict(identity, Range=f"bytes={start}-{end}")
+            written = 0
+
+            with self._stream(url, status=206, headers=headers) as (response, iter_chunks), open(dest, "r+b") as file:
+                file.seek(start)
+                for chunk in iter_chunks(chunk_size):
+                    written += file.write(chunk)
+
+            if written != end - start + 1:
+                raise OSError(f"Range {start}-{end} of {url} returned {written} bytes.")
+
+        with open(dest, "wb") as file:
+            file.truncate(size)
+
+        try:
+            with ThreadPoolExecutor(max_workers=parts) as executor:
+                list(executor.map(fetch, range(parts)))
+        except BaseException as error:
+            # A partially filled, full-size file would look complete; don't leave it behind.
+            with suppress(OSError):
+                os.remove(dest)
+
+            if not (isinstance(error, NessusError) and error.status_code == 200):
+                raise
+
+            logger.debug("GET %s ignored Range; falling back to a single download", url)
+            return self.scans_export_download(scan_id, file_id, dest, chunk_size)
+
+        return dest
+
+
     def scans_export_request(self, scan_id: int, format: str, scan_info: bool = True, host_info: bool = True, base_score: bool = True,
                              synopsis: bool = True, description: bool = True, see_also: bool = True, solution: bool = True, temporal_score: bool = True,
                              risk_factor: bool = True, base_score_v3: bool = True, temporal_score_v3: bool = True, stig: bool = True,
@@ -201,40 +573,26 @@ class NessusClient:
             format (str): File format to use (Nessus, HTML, PDF, CSV, or DB).
         """
 
+        host_sections = self._EXPORT_HOST_SECTIONS
+        if not (host_info and scan_info):
+            host_sections = {"host_information": host_info, "scan_information": scan_info}
+
+        # Flags in _EXPORT_VULN_SECTIONS key order; only build a new dict if any was switched off.
+        vuln_flags = (description, see_also, solution, risk_factor, base_score, temporal_score, base_score_v3,
+                      temporal_score_v3, stig, references, exploitable_with, plugin_info, plugin_output)
+        vuln_sections = self._EXPORT_VULN_SECTIONS
+        if not all(vuln_flags):
+            vuln_sections = dict(zip(self._EXPORT_VULN_SECTIONS, vuln_flags))
+
         payload = {
-                    "format": format,
-                    "reportContents":
-                        {
-                         "hostSections":
-                            {
-                             "host_information": host_info,
-                             "scan_information": scan_info
-                             },
-                         "vulnerabilitySections":
-                            {
-                             "description": description,
-                             "see_also": see_also,
-                             "solution": solution,
-                             "risk_factor": risk_factor,
-                             "cvss_base_score": base_score,
-                             "cvss_temporal_score": temporal_score,
-                             "cvss3_base_score": base_score_v3,
-                             "cvss3_temporal_score": temporal_score_v3,
-                             "stig_severity": stig,
-                             "references": references,
-                             "exploitable_with": exploitable_with,
-                             "plugin_information": plugin_info,
-                             "plugin_output": plugin_output
-                             }
-                        }
-                    }
-
-        response = self.session.post(self.base_url + f"/scans/{scan_id}/export", data=payload)
-
-        if response.status_code == 200:
-            return response.json()
-        else:
-            print(response.status_code, "\n", response.headers, "\n", response.text)
+            "format": format,
+            "reportContents": {
+                "hostSections": host_sections,
+                "vulnerabilitySections": vuln_sections
+            }
+        }
+
+        return self._request("POST", self.base_url + f"/scans/{scan_id}/export", **self._json_body(payload))
     
 
     def scans_export_status(self, scan_id: int, file_id: int):
@@ -246,12 +604,42 @@ class NessusClient:
             file_id (int): ID of file to poll.
         """
 
-        response = self.session.get(self.base_url + f"/scans/{scan_id}/export/{file_id}/status")
+        return self._request("GET", self.base_url + f"/scans/{scan_id}/export/{file_id}/status")
 
-        if response.status_code == 200:
-            return response.json()
-        else:
-            print(response.status_code, "\n", response.headers, "\n", response.text)
+
+    def scans_export_wait(self, scan_id: int, file_id: int, poll_initial: float = 0.5, poll_max: float = 8.0,
+                          timeout: float = 600):
+        """
+        Poll an export with exponential backoff until it is ready. Preferred over looping on
+        scans_export_status(); call it between scans_export_request() and scans_export_download().
+
+        Args:
+            scan_id (int): ID of requested scan.
+            file_id (int): ID of file to poll.
+            poll_initial (float, optional): Seconds to wait after the first poll. Defaults to 0.5.
+            poll_max (float, optional): Upper bound on the wait between polls. Defaults to 8.
+            timeout (float, optional): Seconds to wait before giving up. Defaults to 600.
+
+        Raises:
+            RuntimeError: The scanner reported the export as failed.
+            TimeoutError: The export was not ready within timeout seconds.
+        """
+
+        delay = poll_initial
+        deadline = time.monotonic() + timeout
+
+        while time.monotonic() < deadline:
+            status = self.scans_export_status(scan_id, file_id)
+
+            if status.get("status") == "ready":
+                return status
+            if status.get("status") == "error":
+                raise RuntimeError(f"Export {file_id} of scan {scan_id} failed on the scanner.")
+
+            time.sleep(max(0.0, min(delay, deadline - time.monotonic())))
+            delay = min(delay * 1.7, poll_max)
+
+        raise TimeoutError(f"Export {file_id} of scan {scan_id} not ready after {timeout} seconds.")
 
     
     def scans_host_details(self, scan_id: int, host_id: int):
@@ -263,12 +651,26 @@ class NessusClient:
             host_id (int): ID of the host to retrieve.
         """
 
-        response = self.session.get(self.base_url + f"/scans/{scan_id}/hosts/{host_id}")
+        return self._request("GET", self.base_url + f"/scans/{scan_id}/hosts/{host_id}")
 
-        if response.status_code == 200:
-            return response.json()
-        else:
-            print(response.status_code, "\n", response.headers, "\n", response.text)
+
+    def scans_host_details_bulk(self, scan_id: int, host_ids, max_workers: int = 16):
+        """
+        Retrieve details for many hosts concurrently over the shared session.
+
+        Args:
+            scan_id (int): ID of scan to retrieve.
+            host_ids (iterable): IDs of the hosts to retrieve.
+            max_workers (int, optional): Concurrent requests; capped at pool_maxsize. Defaults to 16.
+
+        Returns:
+            dict: host_id -> host details.
+        """
+
+        def fetch(host_id):
+            return host_id, self.scans_host_details(scan_id, host_id)
+
+        return self._fan_out(fetch, host_ids, max_workers)
 
     
     def scans_list(self, folder_id: int = None, last_mod_date: int = None):
@@ -280,17 +682,8 @@ class NessusClient:
             last_mod_date (int): Limit results to those that have only changed since this time.
         """
 
-        params = {
-            "folder_id": folder_id,
-            "last_modification_date": last_mod_date
-        }
-
-        response = self.session.get(self.base_url + "/scans", params=params)
-
-        if response.status_code == 200:
-            return response.json()
-        else:
-            print(response.status_code, "\n", response.headers, "\n", response.text)
+        return self._request("GET", self.base_url + "/scans",
+                             params=_p(folder_id=folder_id, last_modification_date=last_mod_date))
 
     
     def scans_plugin_output(self, scan_id: int, host_id: int, plugin_id: int, history_id: int = None):
@@ -304,12 +697,25 @@ class NessusClient:
             history_id (int, optional): Historical_ID of the historical data to retrieve.
         """
 
-        params = {"history_id": history_id} if history_id else None
+        return self._request("GET", self.base_url + f"/scans/{scan_id}/hosts/{host_id}/plugins/{plugin_id}",
+                             params=_p(history_id=history_id))
 
-        response = self.session.get(self.base_url + f"/scans/{scan_id}/hosts/{host_id}/plugins/{plugin_id}",
-                                    params=params)
-        
-        if response.status_code == 200:
-            return response.json()
-        else:
-            print(response.status_code, "\n", response.headers, "\n", response.text)
+
+    def scans_plugin_outputs_bulk(self, scan_id: int, items, max_workers: int = 16):
+        """
+        Retrieve output for many host/plugin pairs concurrently over the shared session.
+
+        Args:
+            scan_id (int): ID of scan to retrieve.
+            items (iterable): (host_id, plugin_id, history_id) tuples; history_id may be None.
+            max_workers (int, optional): Concurrent requests; capped at pool_maxsize. Defaults to 16.
+
+        Returns:
+            dict: (host_id, plugin_id) -> plugin output.
+        """
+
+        def fetch(item):
+            host_id, plugin_id, history_id = item
+            return (host_id, plugin_id), self.scans_plugin_output(scan_id, host_id, plugin_id, history_id)
+
+        return self._fan_out(fetch, items, max_workers)